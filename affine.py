@@ -13,27 +13,36 @@ where:
     a must be coprime with m
 """
 
-def gcd(a: int, b: int) -> int:
-    """Calculate the Greatest Common Divisor of a and b."""
-    while b:
-        a, b = b, a % b
-    return a
+import string
+from functools import lru_cache
+from math import gcd
+from typing import Iterable, Iterator
 
+_ALPHABET = string.ascii_uppercase + string.ascii_lowercase
+
+@lru_cache(maxsize=64)
 def mod_inverse(a: int, m: int) -> int:
     """Calculate the modular multiplicative inverse of a modulo m."""
-    def extended_gcd(a: int, b: int) -> tuple:
-        if a == 0:
-            return b, 0, 1
-        gcd, x1, y1 = extended_gcd(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        return gcd, x, y
+    try:
+        return pow(a % m, -1, m)
+    except ValueError:
+        raise ValueError("Modular inverse does not exist") from None
 
-    if gcd(a, m) != 1:
-        raise ValueError("Modular inverse does not exist")
-    
-    _, x, _ = extended_gcd(a, m)
-    return x % m
+def _affine_alphabet(a: int, b: int) -> str:
+    """Return the upper and lower case alphabets with each letter x mapped to (ax + b) mod 26."""
+    shifted_upper = ''.join(string.ascii_uppercase[(a * x + b) % 26] for x in range(26))
+    return shifted_upper + shifted_upper.lower()
+
+@lru_cache(maxsize=64)
+def _affine_table(a: int, b: int) -> dict:
+    """Build the str.translate table mapping each letter x to (ax + b) mod 26."""
+    return str.maketrans(_ALPHABET, _affine_alphabet(a, b))
+
+@lru_cache(maxsize=64)
+def _affine_byte_table(a: int, b: int) -> bytes:
+    """Build the bytes.translate table mapping each letter x to (ax + b) mod 26."""
+    return bytes.maketrans(_ALPHABET.encode('ascii'),
+                           _affine_alphabet(a, b).encode('ascii'))
 
 def encrypt(text: str, a: int, b: int) -> str:
     """
@@ -53,23 +62,8 @@ def encrypt(text: str, a: int, b: int) -> str:
     if gcd(a, 26) != 1:
         raise ValueError("'a' must be coprime with 26")
     
-    result = ""
-    for char in text:
-        if char.isalpha():
-            # Determine the case and base ASCII value
-            is_upper = char.isupper()
-            x = ord(char.upper()) - ord('A')
-            
-            # Apply affine transformation: E(x) = (ax + b) mod 26
-            encrypted_x = (a * x + b) % 26
-            
-            # Convert back to character
-            encrypted_char = chr(encrypted_x + ord('A'))
-            result += encrypted_char if is_upper else encrypted_char.lower()
-        else:
-            result += char
-    
-    return result
+    # Apply affine transformation: E(x) = (ax + b) mod 26
+    return text.translate(_affine_table(a % 26, b % 26))
 
 def decrypt(text: str, a: int, b: int) -> str:
     """
@@ -92,23 +86,56 @@ def decrypt(text: str, a: int, b: int) -> str:
     # Calculate modular multiplicative inverse of a
     a_inv = mod_inverse(a, 26)
     
-    result = ""
-    for char in text:
-        if char.isalpha():
-            # Determine the case and base ASCII value
-            is_upper = char.isupper()
-            y = ord(char.upper()) - ord('A')
-            
-            # Apply affine transformation: D(y) = a^(-1)(y - b) mod 26
-            decrypted_y = (a_inv * (y - b)) % 26
-            
-            # Convert back to character
-            decrypted_char = chr(decrypted_y + ord('A'))
-            result += decrypted_char if is_upper else decrypted_char.lower()
-        else:
-            result += char
-    
-    return result
+    # D(y) = a^(-1)(y - b) mod 26 is itself an affine map with
+    # multiplier a^(-1) and offset -a^(-1)b
+    return text.translate(_affine_table(a_inv, (-a_inv * b) % 26))
+
+def encrypt_stream(chunks: Iterable[bytes], a: int, b: int) -> Iterator[bytes]:
+    """
+    Encrypt a stream of byte chunks using the Affine cipher, one chunk at a time.
+    Only ASCII letters are changed, so ASCII, Latin-1 and UTF-8 input all work.
+    
+    Args:
+        chunks (Iterable[bytes]): The plaintext chunks (bytes or memoryview)
+        a (int): The multiplicative key (must be coprime with 26)
+        b (int): The additive key
+    
+    Yields:
+        bytes: The encrypted chunks
+    
+    Raises:
+        ValueError: If 'a' is not coprime with 26
+    """
+    if gcd(a, 26) != 1:
+        raise ValueError("'a' must be coprime with 26")
+    
+    return _translate_stream(chunks, _affine_byte_table(a % 26, b % 26))
+
+def decrypt_stream(chunks: Iterable[bytes], a: int, b: int) -> Iterator[bytes]:
+    """
+    Decrypt a stream of byte chunks using the Affine cipher, one chunk at a time.
+    
+    Args:
+        chunks (Iterable[bytes]): The ciphertext chunks (bytes or memoryview)
+        a (int): The multiplicative key used for encryption
+        b (int): The additive key used for encryption
+    
+    Yields:
+        bytes: The decrypted chunks
+    
+    Raises:
+        ValueError: If 'a' is not coprime with 26
+    """
+    if gcd(a, 26) != 1:
+        raise ValueError("'a' must be coprime with 26")
+    
+    a_inv = mod_inverse(a, 26)
+    return _translate_stream(chunks, _affine_byte_table(a_inv, (-a_inv * b) % 26))
+
+def _translate_stream(chunks: Iterable[bytes], table: bytes) -> Iterator[bytes]:
+    """Apply a bytes.translate table to each chunk in turn."""
+    for chunk in chunks:
+        yield bytes(chunk).translate(table)
 
 if __name__ == "__main__":
     # Example usage
@@ -9,6 +9,19 @@ Example:
     HELLO becomes SVOOL
 """
 
+from typing import Iterable, Iterator
+
+# Atbash is a single fixed permutation, so module-level translation tables
+# let str.translate and bytes.translate do all the work in C
+_ATBASH = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    "ZYXWVUTSRQPONMLKJIHGFEDCBAzyxwvutsrqponmlkjihgfedcba"
+)
+_ATBASH_BYTES = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    b"ZYXWVUTSRQPONMLKJIHGFEDCBAzyxwvutsrqponmlkjihgfedcba"
+)
+
 def encrypt(text: str) -> str:
     """
     Encrypt the given text using the Atbash cipher.
@@ -19,17 +32,7 @@ def encrypt(text: str) -> str:
     Returns:
         str: The encrypted text
     """
-    result = ""
-    for char in text:
-        if char.isalpha():
-            # Determine the case and base ASCII value
-            if char.isupper():
-                result += chr(ord('Z') - (ord(char) - ord('A')))
-            else:
-                result += chr(ord('z') - (ord(char) - ord('a')))
-        else:
-            result += char
-    return result
+    return text.translate(_ATBASH)
 
 def decrypt(text: str) -> str:
     """
@@ -44,6 +47,33 @@ def decrypt(text: str) -> str:
     """
     return encrypt(text)  # Atbash is its own inverse
 
+def encrypt_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Encrypt a stream of byte chunks using the Atbash cipher, one chunk at a time.
+    Only ASCII letters are changed, so ASCII, Latin-1 and UTF-8 input all work.
+    
+    Args:
+        chunks (Iterable[bytes]): The plaintext chunks (bytes or memoryview)
+    
+    Yields:
+        bytes: The encrypted chunks
+    """
+    for chunk in chunks:
+        yield bytes(chunk).translate(_ATBASH_BYTES)
+
+def decrypt_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Decrypt a stream of byte chunks using the Atbash cipher.
+    Since Atbash is its own inverse, this is the same as encryption.
+    
+    Args:
+        chunks (Iterable[bytes]): The ciphertext chunks (bytes or memoryview)
+    
+    Yields:
+        bytes: The decrypted chunks
+    """
+    return encrypt_stream(chunks)
+
 if __name__ == "__main__":
     # Example usage
     message = "HELLO WORLD"
@@ -13,6 +13,113 @@ Example:
     and so on...
 """
 
+import numpy as np
+from typing import Iterable, Iterator
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy path is used instead
+    njit = None
+
+# _LUT[s, x] = (x + s) mod 26, small enough to stay resident in L1
+_LUT = ((np.arange(26)[:, None] + np.arange(26)[None, :]) % 26).astype(np.uint8)
+
+# Short texts are shifted one character at a time without Numba, for the
+# same reason as vigenere._VECTORIZE_THRESHOLD
+_VECTORIZE_THRESHOLD = 64
+
+if njit is not None:
+    @njit(cache=True)
+    def _shift_kernel(codes: np.ndarray, shift: int, step: int) -> int:
+        """Apply the progressive shift to the codes in place and return the next shift."""
+        for i in range(codes.size):
+            c = codes[i]
+            # Folding case leaves a single range check, and every update
+            # below is a select rather than a branch on the character class
+            letter = (c | 0x20) - 97
+            is_letter = (letter >= 0) & (letter < 26)
+            shifted = letter + shift
+            if shifted >= 26:
+                shifted -= 26
+            codes[i] = shifted + (65 | (c & 0x20)) if is_letter else c
+            shift += step if is_letter else 0
+            if shift >= 26:
+                shift -= 26
+        return shift
+
+def _shift_codes(codes: np.ndarray, shift: int, step: int) -> int:
+    """
+    Shift the k-th letter in an array of character codes by shift + k * step,
+    in place.
+    
+    Args:
+        codes (np.ndarray): Unsigned character codes (bytes or code points)
+        shift (int): The shift applied to the first letter
+        step (int): The change in shift from one letter to the next
+    
+    Returns:
+        int: The shift to apply to the letter following the array
+    """
+    # Reduce first so both paths agree and the arithmetic stays within int64
+    shift %= 26
+    step %= 26
+    if njit is not None:
+        return _shift_kernel(codes, shift, step)
+    
+    # Setting bit 5 folds 'A'-'Z' onto 'a'-'z', so after subtracting 'a' a
+    # single unsigned compare picks out the letters
+    letters = (codes | codes.dtype.type(0x20)) - codes.dtype.type(97)
+    alpha_mask = letters < 26
+    ascii_base = 65 | (codes[alpha_mask] & 0x20)
+    
+    # Only letters advance the shift, so the k-th letter gets the k-th shift
+    shifts = (shift + step * np.arange(ascii_base.size, dtype=np.int64)) % 26
+    codes[alpha_mask] = _LUT[shifts, letters[alpha_mask]] + ascii_base
+    
+    return (shift + step * ascii_base.size) % 26
+
+def _progressive_shift_scalar(text: str, shift: int, step: int) -> str:
+    """Shift the letters of a short text one at a time, as _shift_codes does for arrays."""
+    shift %= 26
+    step %= 26
+    result = []
+    append = result.append
+    for char in text:
+        code = ord(char)
+        letter = (code | 0x20) - 97
+        if 0 <= letter < 26:
+            append(chr((letter + shift) % 26 + (65 | (code & 0x20))))
+            shift = (shift + step) % 26
+        else:
+            append(char)
+    return ''.join(result)
+
+def _progressive_shift(text: str, initial_shift: int, step: int) -> str:
+    """
+    Shift the k-th letter of the text by initial_shift + k * step.
+    
+    Args:
+        text (str): The text to process
+        initial_shift (int): The shift applied to the first letter
+        step (int): The change in shift from one letter to the next
+    
+    Returns:
+        str: The processed text
+    """
+    if njit is None and len(text) < _VECTORIZE_THRESHOLD:
+        return _progressive_shift_scalar(text, initial_shift, step)
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).copy()
+    _shift_codes(codes, initial_shift, step)
+    return codes.tobytes().decode('utf-32-le')
+
+def _progressive_shift_stream(chunks: Iterable[bytes], initial_shift: int, step: int) -> Iterator[bytes]:
+    """Apply the progressive shift chunk by chunk, carrying the shift across chunks."""
+    shift = initial_shift
+    for chunk in chunks:
+        codes = np.frombuffer(chunk, dtype=np.uint8).copy()
+        shift = _shift_codes(codes, shift, step)
+        yield codes.tobytes()
+
 def encrypt(text: str, initial_shift: int = 1) -> str:
     """
     Encrypt the given text using the August cipher.
@@ -24,22 +131,7 @@ def encrypt(text: str, initial_shift: int = 1) -> str:
     Returns:
         str: The encrypted text
     """
-    result = ""
-    shift = initial_shift
-    
-    for char in text:
-        if char.isalpha():
-            # Determine the case and base ASCII value
-            ascii_base = ord('A') if char.isupper() else ord('a')
-            # Apply progressive shift and wrap around using modulo
-            shifted = (ord(char) - ascii_base + shift) % 26
-            result += chr(ascii_base + shifted)
-            shift += 1  # Increase shift for next character
-        else:
-            result += char
-            # Don't increase shift for non-alphabetic characters
-    
-    return result
+    return _progressive_shift(text, initial_shift, 1)
 
 def decrypt(text: str, initial_shift: int = 1) -> str:
     """
@@ -52,22 +144,34 @@ def decrypt(text: str, initial_shift: int = 1) -> str:
     Returns:
         str: The decrypted text
     """
-    result = ""
-    shift = initial_shift
+    return _progressive_shift(text, -initial_shift, -1)
+
+def encrypt_stream(chunks: Iterable[bytes], initial_shift: int = 1) -> Iterator[bytes]:
+    """
+    Encrypt a stream of byte chunks using the August cipher, one chunk at a time.
+    Only ASCII letters are changed, so ASCII, Latin-1 and UTF-8 input all work.
     
-    for char in text:
-        if char.isalpha():
-            # Determine the case and base ASCII value
-            ascii_base = ord('A') if char.isupper() else ord('a')
-            # Apply reverse progressive shift and wrap around using modulo
-            shifted = (ord(char) - ascii_base - shift) % 26
-            result += chr(ascii_base + shifted)
-            shift += 1  # Increase shift for next character
-        else:
-            result += char
-            # Don't increase shift for non-alphabetic characters
+    Args:
+        chunks (Iterable[bytes]): The plaintext chunks (bytes or memoryview)
+        initial_shift (int): The initial shift value (default: 1)
     
-    return result
+    Yields:
+        bytes: The encrypted chunks
+    """
+    return _progressive_shift_stream(chunks, initial_shift, 1)
+
+def decrypt_stream(chunks: Iterable[bytes], initial_shift: int = 1) -> Iterator[bytes]:
+    """
+    Decrypt a stream of byte chunks using the August cipher, one chunk at a time.
+    
+    Args:
+        chunks (Iterable[bytes]): The ciphertext chunks (bytes or memoryview)
+        initial_shift (int): The initial shift value used for encryption (default: 1)
+    
+    Yields:
+        bytes: The decrypted chunks
+    """
+    return _progressive_shift_stream(chunks, -initial_shift, -1)
 
 if __name__ == "__main__":
     # Example usage
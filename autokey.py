@@ -9,9 +9,11 @@ cipher because the key does not repeat in a predictable pattern.
 Example:
     Plaintext: HELLO WORLD
     Priming Key: KEY
-    Full Key: KEY + HELLO WORLD = KEYHELLOWORL
+    Full Key: KEY + HELLOWORLD = KEYHELLOWO
 """
 
+_ORD_A = 65  # ord('A')
+
 def prepare_key(text: str, priming_key: str) -> str:
     """
     Prepare the key by combining the priming key with the plaintext,
@@ -22,23 +24,10 @@ def prepare_key(text: str, priming_key: str) -> str:
         priming_key (str): The initial key
     
     Returns:
-        str: The prepared key
+        str: The prepared key, one letter for each letter of the text
     """
-    priming_key = priming_key.upper()
-    text = text.upper()
-    key = list(priming_key)
-    text_index = 0
-    
-    # Build the full key using the plaintext
-    for i in range(len(priming_key), len(text)):
-        if text[text_index].isalpha():
-            key.append(text[text_index])
-            text_index += 1
-        else:
-            key.append(text[text_index])
-            text_index += 1
-            
-    return ''.join(key)
+    letters = ''.join(c for c in text.upper() if c.isalpha())
+    return (priming_key.upper() + letters)[:len(letters)]
 
 def encrypt(text: str, priming_key: str) -> str:
     """
@@ -50,26 +39,35 @@ def encrypt(text: str, priming_key: str) -> str:
     
     Returns:
         str: The encrypted text
+    
+    Raises:
+        ValueError: If the priming key is empty
     """
-    key = prepare_key(text, priming_key)
-    result = ""
+    if not priming_key:
+        raise ValueError("Priming key must not be empty")
     
-    for text_char, key_char in zip(text, key):
-        if text_char.isalpha():
-            # Determine the case and base ASCII value
-            is_upper = text_char.isupper()
-            text_num = ord(text_char.upper()) - ord('A')
-            key_num = ord(key_char.upper()) - ord('A')
+    # Convert the key to numbers once, outside the character loop
+    key_nums = [ord(c) - _ORD_A for c in prepare_key(text, priming_key)]
+    text_upper = text.upper()
+    result = []
+    key_index = 0
+    
+    for i, char in enumerate(text_upper):
+        if char.isalpha():
+            text_num = ord(char) - _ORD_A
+            key_num = key_nums[key_index]
+            key_index += 1
             
             # Apply Autokey shift (similar to Vigenère)
             encrypted_num = (text_num + key_num) % 26
-            encrypted_char = chr(encrypted_num + ord('A'))
+            encrypted_char = chr(encrypted_num + _ORD_A)
             
-            result += encrypted_char if is_upper else encrypted_char.lower()
+            # Preserve the case of the original character
+            result.append(encrypted_char if text[i].isupper() else encrypted_char.lower())
         else:
-            result += text_char
+            result.append(text[i])
     
-    return result
+    return ''.join(result)
 
 def decrypt(text: str, priming_key: str) -> str:
     """
@@ -81,32 +79,36 @@ def decrypt(text: str, priming_key: str) -> str:
     
     Returns:
         str: The decrypted text
+    
+    Raises:
+        ValueError: If the priming key is empty
     """
-    result = ""
-    key = list(priming_key.upper())
-    text_index = 0
+    if not priming_key:
+        raise ValueError("Priming key must not be empty")
     
-    for i, char in enumerate(text):
+    # The running key starts as the priming key and grows by one number for
+    # every letter recovered
+    key_nums = [ord(c) - _ORD_A for c in priming_key.upper()]
+    text_upper = text.upper()
+    result = []
+    key_index = 0
+    
+    for i, char in enumerate(text_upper):
         if char.isalpha():
-            # Determine the case and base ASCII value
-            is_upper = char.isupper()
-            text_num = ord(char.upper()) - ord('A')
-            
-            if i < len(priming_key):
-                key_num = ord(key[i].upper()) - ord('A')
-            else:
-                key_num = ord(result[text_index].upper()) - ord('A')
-                text_index += 1
+            text_num = ord(char) - _ORD_A
+            key_num = key_nums[key_index]
+            key_index += 1
             
             # Apply reverse Autokey shift
             decrypted_num = (text_num - key_num) % 26
-            decrypted_char = chr(decrypted_num + ord('A'))
+            decrypted_char = chr(decrypted_num + _ORD_A)
             
-            result += decrypted_char if is_upper else decrypted_char.lower()
+            result.append(decrypted_char if text[i].isupper() else decrypted_char.lower())
+            key_nums.append(decrypted_num)
         else:
-            result += char
+            result.append(text[i])
             
-    return result
+    return ''.join(result)
 
 if __name__ == "__main__":
     # Example usage
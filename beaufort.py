@@ -17,30 +17,65 @@ Example:
     Process: For H: K - H mod 26, For E: E - E mod 26, etc.
 """
 
-def prepare_key(text: str, key: str) -> str:
+import numpy as np
+from typing import List
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy path is used instead
+    njit = None
+
+# _LUT[k, p] = (k - p) mod 26
+_LUT = ((np.arange(26)[:, None] - np.arange(26)[None, :]) % 26).astype(np.uint8)
+
+# Short texts are transformed one character at a time without Numba, for the
+# same reason as vigenere._VECTORIZE_THRESHOLD
+_VECTORIZE_THRESHOLD = 96
+
+if njit is not None:
+    @njit(cache=True)
+    def _beaufort_kernel(codes: np.ndarray, key_nums: np.ndarray, lut: np.ndarray) -> None:
+        """Apply the Beaufort transformation to the code points in place."""
+        key_index = 0
+        for i in range(codes.size):
+            c = codes[i]
+            # Branchless letter test, as in august._shift_kernel
+            letter = (c | 0x20) - 97
+            is_letter = (letter >= 0) & (letter < 26)
+            transformed = lut[key_nums[key_index], letter if is_letter else 0]
+            codes[i] = transformed + (65 | (c & 0x20)) if is_letter else c
+            key_index += 1 if is_letter else 0
+            if key_index == key_nums.size:
+                key_index = 0
+
+def prepare_key(key: str) -> List[int]:
     """
-    Prepare the key by repeating it to match the length of the text,
-    ignoring non-alphabetic characters in the text.
+    Convert the key to its letter values (A=0, B=1, etc.) once, so the
+    cipher repeats numbers instead of re-reading key characters.
     
     Args:
-        text (str): The text to match length with
-        key (str): The key to repeat
+        key (str): The key to convert
     
     Returns:
-        str: The prepared key
+        List[int]: The value of each key letter
     """
-    key = key.upper()
-    key_repeated = ""
+    return [(code - 65) % 26 for code in map(ord, key.upper())]
+
+def _beaufort_scalar(text: str, key_nums: List[int]) -> str:
+    """Transform the letters of a short text one at a time, as the vectorized path does."""
+    result = []
+    append = result.append
+    key_length = len(key_nums)
     key_index = 0
-    
     for char in text:
-        if char.isalpha():
-            key_repeated += key[key_index % len(key)]
-            key_index += 1
+        code = ord(char)
+        letter = (code | 0x20) - 97
+        if 0 <= letter < 26:
+            append(chr((key_nums[key_index] - letter) % 26 + (65 | (code & 0x20))))
+            key_index = (key_index + 1) % key_length
         else:
-            key_repeated += char
-            
-    return key_repeated
+            append(char)
+    return ''.join(result)
 
 def beaufort(text: str, key: str) -> str:
     """
@@ -53,26 +88,33 @@ def beaufort(text: str, key: str) -> str:
     
     Returns:
         str: The processed text
+    
+    Raises:
+        ValueError: If the key is empty
     """
-    key = prepare_key(text, key)
-    result = ""
+    if not key:
+        raise ValueError("Key must not be empty")
+    key_nums = prepare_key(key)
+    if njit is None and len(text) < _VECTORIZE_THRESHOLD:
+        return _beaufort_scalar(text, key_nums)
     
-    for text_char, key_char in zip(text, key):
-        if text_char.isalpha():
-            # Determine the case and base ASCII value
-            is_upper = text_char.isupper()
-            text_num = ord(text_char.upper()) - ord('A')
-            key_num = ord(key_char.upper()) - ord('A')
-            
-            # Apply Beaufort transformation: C = (K - P) mod 26
-            beaufort_num = (key_num - text_num) % 26
-            beaufort_char = chr(beaufort_num + ord('A'))
-            
-            result += beaufort_char if is_upper else beaufort_char.lower()
-        else:
-            result += text_char
+    key_nums = np.array(key_nums, dtype=np.int64)
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).copy()
+    if njit is not None:
+        _beaufort_kernel(codes, key_nums, _LUT)
+        return codes.tobytes().decode('utf-32-le')
+    
+    # Case-folded letter test, as in august._shift_codes
+    letters = (codes | np.uint32(0x20)) - np.uint32(97)
+    alpha_mask = letters < 26
+    ascii_base = 65 | (codes[alpha_mask] & 0x20)
+    
+    # Apply Beaufort transformation: C = (K - P) mod 26, repeating the key
+    # over the alphabetic positions only
+    key_nums = np.resize(key_nums, ascii_base.size)
+    codes[alpha_mask] = _LUT[key_nums, letters[alpha_mask]] + ascii_base
     
-    return result
+    return codes.tobytes().decode('utf-32-le')
 
 # Since the Beaufort cipher is reciprocal, encryption and decryption use the same function
 encrypt = beaufort
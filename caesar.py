@@ -9,6 +9,29 @@ Example:
     With a shift of 3, A would be replaced by D, B would become E, and so on.
 """
 
+import string
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+_ALPHABET = string.ascii_uppercase + string.ascii_lowercase
+
+def _shifted_alphabet(shift: int) -> str:
+    """Return the upper and lower case alphabets rotated by shift."""
+    upper = string.ascii_uppercase
+    lower = string.ascii_lowercase
+    return upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift]
+
+@lru_cache(maxsize=26)
+def _shift_table(shift: int) -> dict:
+    """Build the str.translate table for a shift already reduced modulo 26."""
+    return str.maketrans(_ALPHABET, _shifted_alphabet(shift))
+
+@lru_cache(maxsize=26)
+def _byte_shift_table(shift: int) -> bytes:
+    """Build the bytes.translate table for a shift already reduced modulo 26."""
+    return bytes.maketrans(_ALPHABET.encode('ascii'),
+                           _shifted_alphabet(shift).encode('ascii'))
+
 def encrypt(text: str, shift: int) -> str:
     """
     Encrypt the given text using Caesar cipher.
@@ -20,17 +43,9 @@ def encrypt(text: str, shift: int) -> str:
     Returns:
         str: The encrypted text
     """
-    result = ""
-    for char in text:
-        if char.isalpha():
-            # Determine the case and base ASCII value
-            ascii_base = ord('A') if char.isupper() else ord('a')
-            # Apply shift and wrap around using modulo
-            shifted = (ord(char) - ascii_base + shift) % 26
-            result += chr(ascii_base + shifted)
-        else:
-            result += char
-    return result
+    # A fixed shift is a plain permutation of the alphabet, so let
+    # str.translate do the per-character work in C
+    return text.translate(_shift_table(shift % 26))
 
 def decrypt(text: str, shift: int) -> str:
     """
@@ -46,6 +61,35 @@ def decrypt(text: str, shift: int) -> str:
     # Decryption is just encryption with the negative shift
     return encrypt(text, -shift)
 
+def encrypt_stream(chunks: Iterable[bytes], shift: int) -> Iterator[bytes]:
+    """
+    Encrypt a stream of byte chunks using Caesar cipher, one chunk at a time.
+    Only ASCII letters are changed, so ASCII, Latin-1 and UTF-8 input all work.
+    
+    Args:
+        chunks (Iterable[bytes]): The plaintext chunks (bytes or memoryview)
+        shift (int): The number of positions to shift each letter
+    
+    Yields:
+        bytes: The encrypted chunks
+    """
+    table = _byte_shift_table(shift % 26)
+    for chunk in chunks:
+        yield bytes(chunk).translate(table)
+
+def decrypt_stream(chunks: Iterable[bytes], shift: int) -> Iterator[bytes]:
+    """
+    Decrypt a stream of byte chunks using Caesar cipher, one chunk at a time.
+    
+    Args:
+        chunks (Iterable[bytes]): The ciphertext chunks (bytes or memoryview)
+        shift (int): The number of positions that were shifted
+    
+    Yields:
+        bytes: The decrypted chunks
+    """
+    return encrypt_stream(chunks, -shift)
+
 if __name__ == "__main__":
     # Example usage
     message = "HELLO WORLD"
@@ -17,8 +17,73 @@ Example using a 2×2 matrix:
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import List, Tuple
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy matmul is used instead
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _hill_apply(key: np.ndarray, data: np.ndarray, block: int) -> None:
+        """Multiply each block of data by the key matrix modulo 26, in place."""
+        buf = np.empty(block, np.int64)
+        for start in range(0, data.size, block):
+            for i in range(block):
+                buf[i] = data[start + i]
+            for i in range(block):
+                acc = 0
+                for j in range(block):
+                    acc += key[i, j] * buf[j]
+                data[start + i] = acc % 26
+
+def apply_key(key_matrix: np.ndarray, text_matrix: np.ndarray) -> np.ndarray:
+    """
+    Multiply every block of the text matrix by the key matrix modulo 26.
+    
+    Args:
+        key_matrix (np.ndarray): The key matrix to apply
+        text_matrix (np.ndarray): The text blocks, one block per row
+    
+    Returns:
+        np.ndarray: The transformed letter values, flattened in text order
+    """
+    if njit is None:
+        return ((key_matrix @ text_matrix.T) % 26).T.flatten()
+    
+    data = np.ascontiguousarray(text_matrix, dtype=np.int64).reshape(-1).copy()
+    key = np.ascontiguousarray(key_matrix, dtype=np.int64)
+    _hill_apply(key, data, key.shape[0])
+    return data
+
+def small_adjugate(matrix: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Calculate the adjugate and determinant of a 2×2 or 3×3 integer matrix
+    using closed-form cofactors, without any floating point.
+    
+    Args:
+        matrix (np.ndarray): The 2×2 or 3×3 matrix
+    
+    Returns:
+        Tuple[np.ndarray, int]: The adjugate matrix and the determinant
+    """
+    m = [[int(x) for x in row] for row in matrix]
+    
+    if len(m) == 2:
+        (a, b), (c, d) = m
+        adj = [[d, -b],
+               [-c, a]]
+        return np.array(adj, dtype=np.int64), a * d - b * c
+    
+    (a, b, c), (d, e, f), (g, h, i) = m
+    adj = [[e * i - f * h, c * h - b * i, b * f - c * e],
+           [f * g - d * i, a * i - c * g, c * d - a * f],
+           [d * h - e * g, b * g - a * h, a * e - b * d]]
+    det = a * adj[0][0] + b * adj[1][0] + c * adj[2][0]
+    return np.array(adj, dtype=np.int64), det
+
 def matrix_mod_inverse(matrix: np.ndarray, modulus: int) -> np.ndarray:
     """
     Calculate the modular multiplicative inverse of a matrix.
@@ -33,16 +98,28 @@ def matrix_mod_inverse(matrix: np.ndarray, modulus: int) -> np.ndarray:
     Raises:
         ValueError: If the matrix is not invertible modulo the given modulus
     """
-    det = int(round(np.linalg.det(matrix)))
+    if len(matrix) in (2, 3):
+        # Exact integer arithmetic for the usual key sizes
+        adj, det = small_adjugate(matrix)
+    else:
+        det = int(round(np.linalg.det(matrix)))
+        # Calculate adjugate matrix
+        adj = np.round(det * np.linalg.inv(matrix)).astype(int)
     det_inv = pow(det % modulus, -1, modulus)
     
-    # Calculate adjugate matrix
-    adj = np.round(det * np.linalg.inv(matrix)).astype(int)
-    
     # Calculate modular multiplicative inverse
     inv = (det_inv * adj) % modulus
     return inv
 
+@lru_cache(maxsize=64)
+def _cached_mod_inverse(key_bytes: bytes, size: int, modulus: int) -> np.ndarray:
+    """Cache matrix_mod_inverse for keys passed as raw int64 bytes."""
+    matrix = np.frombuffer(key_bytes, dtype=np.int64).reshape(size, size)
+    inv = matrix_mod_inverse(matrix, modulus)
+    # The cached array is shared between callers, so keep it read-only
+    inv.flags.writeable = False
+    return inv
+
 def prepare_text(text: str, block_size: int) -> Tuple[np.ndarray, int]:
     """
     Convert text to a matrix of numbers and pad if necessary.
@@ -54,50 +131,81 @@ def prepare_text(text: str, block_size: int) -> Tuple[np.ndarray, int]:
     Returns:
         Tuple[np.ndarray, int]: The matrix and the number of padding characters added
     """
-    # Remove non-alphabetic characters and convert to uppercase
-    text = ''.join(c for c in text.upper() if c.isalpha())
+    # Keep only the letters as numbers (A=0, B=1, etc.), using the
+    # case-folded letter test from august._shift_codes
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    letters = (codes | np.uint32(0x20)) - np.uint32(97)
+    numbers = letters[letters < 26].astype(np.int64)
     
-    # Pad text if necessary
-    padding = (block_size - len(text) % block_size) % block_size
-    text += 'X' * padding
-    
-    # Convert to numbers (A=0, B=1, etc.)
-    numbers = [ord(c) - ord('A') for c in text]
+    # Pad text with 'X' if necessary
+    padding = (block_size - numbers.size % block_size) % block_size
+    numbers = np.concatenate([numbers, np.full(padding, ord('X') - ord('A'), dtype=np.int64)])
     
     # Reshape into matrix
-    matrix = np.array(numbers).reshape(-1, block_size)
-    return matrix, padding
+    return numbers.reshape(-1, block_size), padding
 
-def encrypt(text: str, key_matrix: np.ndarray) -> str:
+def to_text(numbers: np.ndarray) -> str:
+    """Convert an array of letter values (A=0, B=1, etc.) back to text."""
+    return (np.asarray(numbers) + ord('A')).astype(np.uint8).tobytes().decode('ascii')
+
+def encrypt_batch(texts: List[str], key_matrix: np.ndarray) -> List[str]:
     """
-    Encrypt text using the Hill cipher.
+    Encrypt several texts with the same key using a single matrix multiply.
     
     Args:
-        text (str): The plaintext to encrypt
+        texts (List[str]): The plaintexts to encrypt
         key_matrix (np.ndarray): The key matrix to use
     
     Returns:
-        str: The encrypted text
+        List[str]: The encrypted texts, in the same order
     
     Raises:
         ValueError: If the key matrix is not valid
     """
     block_size = len(key_matrix)
     
-    # Check if key matrix is valid
-    det = int(round(np.linalg.det(key_matrix)))
+    # Check if key matrix is valid, with the same exact determinant
+    # matrix_mod_inverse uses for the usual key sizes
+    if block_size in (2, 3):
+        det = small_adjugate(key_matrix)[1]
+    else:
+        det = int(round(np.linalg.det(key_matrix)))
     if det == 0 or np.gcd(det % 26, 26) != 1:
         raise ValueError("Invalid key matrix: must be invertible modulo 26")
     
-    # Prepare text
-    text_matrix, _ = prepare_text(text, block_size)
+    # Prepare every text and stack the blocks into one matrix
+    text_matrices = [prepare_text(text, block_size)[0] for text in texts]
+    if not text_matrices:
+        return []
+    stacked = np.vstack(text_matrices)
+    
+    # Encrypt: C = KP mod 26, for all blocks at once
+    encrypted = apply_key(key_matrix, stacked)
+    
+    # Split the result back into the individual messages
+    encrypted_text = to_text(encrypted)
+    result = []
+    start = 0
+    for matrix in text_matrices:
+        result.append(encrypted_text[start:start + matrix.size])
+        start += matrix.size
+    return result
+
+def encrypt(text: str, key_matrix: np.ndarray) -> str:
+    """
+    Encrypt text using the Hill cipher.
     
-    # Encrypt: C = KP mod 26
-    encrypted_matrix = (key_matrix @ text_matrix.T) % 26
+    Args:
+        text (str): The plaintext to encrypt
+        key_matrix (np.ndarray): The key matrix to use
     
-    # Convert back to text
-    encrypted_text = ''.join(chr(n + ord('A')) for n in encrypted_matrix.T.flatten())
-    return encrypted_text
+    Returns:
+        str: The encrypted text
+    
+    Raises:
+        ValueError: If the key matrix is not valid
+    """
+    return encrypt_batch([text], key_matrix)[0]
 
 def decrypt(text: str, key_matrix: np.ndarray) -> str:
     """
@@ -116,16 +224,17 @@ def decrypt(text: str, key_matrix: np.ndarray) -> str:
     block_size = len(key_matrix)
     
     # Calculate inverse key matrix
-    key_matrix_inv = matrix_mod_inverse(key_matrix, 26)
+    key = np.ascontiguousarray(key_matrix, dtype=np.int64)
+    key_matrix_inv = _cached_mod_inverse(key.tobytes(), block_size, 26)
     
     # Prepare text
     text_matrix, padding = prepare_text(text, block_size)
     
     # Decrypt: P = K^(-1)C mod 26
-    decrypted_matrix = (key_matrix_inv @ text_matrix.T) % 26
+    decrypted = apply_key(key_matrix_inv, text_matrix)
     
     # Convert back to text and remove padding
-    decrypted_text = ''.join(chr(n + ord('A')) for n in decrypted_matrix.T.flatten())
+    decrypted_text = to_text(decrypted)
     if padding:
         decrypted_text = decrypted_text[:-padding]
     
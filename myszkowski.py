@@ -19,7 +19,8 @@ Example:
 """
 
 from typing import List, Dict, Set
-from collections import defaultdict
+from functools import lru_cache
+import numpy as np
 
 def prepare_text_and_key(text: str, key: str) -> tuple:
     """
@@ -68,6 +69,24 @@ def create_grid(text: str, key: str) -> List[List[str]]:
     
     return grid
 
+@lru_cache(maxsize=128)
+def get_column_order(key: str) -> np.ndarray:
+    """
+    List the column indices in the order they are read off.
+    
+    Args:
+        key (str): The encryption key
+    
+    Returns:
+        np.ndarray: Column indices, grouped by key letter in sorted order
+    """
+    # A stable sort keeps columns sharing a key letter in their original order
+    key_codes = np.frombuffer(key.encode('utf-32-le'), dtype=np.uint32)
+    order = np.argsort(key_codes, kind='stable')
+    # The cached array is shared between callers, so keep it read-only
+    order.flags.writeable = False
+    return order
+
 def get_column_groups(key: str) -> Dict[str, List[int]]:
     """
     Group columns by their key letters.
@@ -78,10 +97,12 @@ def get_column_groups(key: str) -> Dict[str, List[int]]:
     Returns:
         Dict[str, List[int]]: Dictionary mapping key letters to their column indices
     """
-    groups = defaultdict(list)
-    for i, char in enumerate(key):
-        groups[char].append(i)
-    return dict(sorted(groups.items()))
+    if not key:
+        return {}
+    order = get_column_order(key)
+    sorted_codes = np.frombuffer(key.encode('utf-32-le'), dtype=np.uint32)[order]
+    _, starts = np.unique(sorted_codes, return_index=True)
+    return {key[columns[0]]: columns.tolist() for columns in np.split(order, starts[1:])}
 
 def encrypt(text: str, key: str) -> str:
     """
@@ -94,20 +115,15 @@ def encrypt(text: str, key: str) -> str:
     Returns:
         str: The encrypted text
     """
-    # Create the grid
-    grid = create_grid(text, key)
+    text, _, rows = prepare_text_and_key(text, key)
+    cols = len(key)
     
-    # Group columns by key letters
-    column_groups = get_column_groups(key)
+    # Arrange the text in a rows x cols grid of code points
+    grid = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).reshape(rows, cols)
     
     # Read off the columns in order of sorted unique key letters
-    result = []
-    for _, columns in column_groups.items():
-        for col in columns:
-            for row in grid:
-                result.append(row[col])
-    
-    return ''.join(result)
+    order = get_column_order(key)
+    return grid[:, order].T.tobytes().decode('utf-32-le')
 
 def decrypt(text: str, key: str) -> str:
     """
@@ -123,26 +139,13 @@ def decrypt(text: str, key: str) -> str:
     cols = len(key)
     rows = len(text) // cols
     
-    # Create empty grid
-    grid = [['' for _ in range(cols)] for _ in range(rows)]
-    
-    # Group columns by key letters
-    column_groups = get_column_groups(key)
-    
-    # Fill the grid using the column groups
-    index = 0
-    for _, columns in column_groups.items():
-        for col in columns:
-            for row in range(rows):
-                grid[row][col] = text[index]
-                index += 1
-    
-    # Read off row by row
-    result = []
-    for row in grid:
-        result.extend(row)
+    # Fill the columns of the grid in the order they were read off, then
+    # read it back row by row
+    incoming = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)[:rows * cols]
+    grid = np.empty((rows, cols), dtype=np.uint32)
+    grid[:, get_column_order(key)] = incoming.reshape(cols, rows).T
     
-    return ''.join(result)
+    return grid.tobytes().decode('utf-32-le')
 
 if __name__ == "__main__":
     # Example usage
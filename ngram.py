@@ -15,8 +15,92 @@ Common n-gram sizes:
 """
 
 from collections import Counter
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Union
 import re
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy path is used instead
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _adjacent_lcp_kernel(codes: np.ndarray, suffixes: np.ndarray, limit: int) -> np.ndarray:
+        """Compare each pair of neighbouring suffixes on its own thread, stopping at the first mismatch."""
+        n = codes.size
+        lcp = np.zeros(suffixes.size - 1, dtype=np.int64)
+        for k in prange(suffixes.size - 1):
+            previous, current = suffixes[k], suffixes[k + 1]
+            bound = min(limit, n - max(previous, current))
+            length = 0
+            while length < bound and codes[previous + length] == codes[current + length]:
+                length += 1
+            lcp[k] = length
+        return lcp
+
+# Below this length NumPy's per-call overhead outweighs counting with Counter
+_PACKED_THRESHOLD = 1024
+
+# Short texts are faster to scan window by window than to build a suffix array for
+_SUFFIX_ARRAY_THRESHOLD = 200
+
+# A maximal run of word characters always sits between word boundaries, so
+# these match the same words as r'\b\w+\b' without the boundary checks.
+# The ASCII-only engine is faster and agrees with the Unicode one on ASCII text
+_WORD_RE = re.compile(r'\w+')
+_ASCII_WORD_RE = re.compile(r'\w+', re.ASCII)
+
+def _tokenize(text: str, as_word: bool) -> Union[str, List[str]]:
+    """Return the upper-cased text, or its lower-cased words when as_word is set."""
+    if as_word:
+        # Split into words and remove punctuation
+        word_re = _ASCII_WORD_RE if text.isascii() else _WORD_RE
+        return word_re.findall(text.lower())
+    return text.upper()
+
+def _iter_ngrams(tokens: Union[str, List[str]], n: int, as_word: bool) -> Iterator[str]:
+    """Yield the n-grams of already tokenized text without building a list."""
+    if as_word:
+        join = ' '.join
+        return (join(tokens[i:i+n]) for i in range(len(tokens)-n+1))
+    return (tokens[i:i+n] for i in range(len(tokens)-n+1))
+
+def _packed_ngram_counts(text: str, n: int) -> Counter:
+    """
+    Count the character n-grams of a Latin-1 string by packing each n-gram
+    into one 32-bit integer, so the counting runs in np.unique.
+    
+    Args:
+        text (str): The already upper-cased text, encodable as Latin-1
+        n (int): The size of each n-gram, at most 4
+    
+    Returns:
+        Counter: Occurrences of each n-gram, in order of first appearance
+    """
+    data = np.frombuffer(text.encode('latin-1'), dtype=np.uint8)
+    windows = np.lib.stride_tricks.sliding_window_view(data, n)
+    packed = np.zeros(len(windows), dtype=np.uint32)
+    for k in range(n):
+        packed |= windows[:, k].astype(np.uint32) << np.uint32(8 * k)
+    _, first, counts = np.unique(packed, return_index=True, return_counts=True)
+    
+    # Keep Counter's insertion order so most_common() breaks ties the same way
+    order = np.argsort(first)
+    ngrams = [text[i:i+n] for i in first[order].tolist()]
+    return Counter(dict(zip(ngrams, counts[order].tolist())))
+
+def _count_ngrams(tokens: Union[str, List[str]], n: int, as_word: bool) -> Counter:
+    """Count the n-grams of already tokenized text."""
+    # Past 4 characters most n-grams are distinct, and building their strings
+    # back costs as much as counting them with Counter in the first place
+    if not as_word and n <= 4 and len(tokens) >= _PACKED_THRESHOLD:
+        try:
+            return _packed_ngram_counts(tokens, n)
+        except UnicodeEncodeError:
+            # Characters beyond Latin-1 do not fit in one byte each
+            pass
+    return Counter(_iter_ngrams(tokens, n, as_word))
 
 def get_ngrams(text: str, n: int, as_word: bool = False) -> List[str]:
     """
@@ -36,19 +120,14 @@ def get_ngrams(text: str, n: int, as_word: bool = False) -> List[str]:
     if n < 1:
         raise ValueError("n must be at least 1")
     
-    # Prepare text
-    if as_word:
-        # Split into words and remove punctuation
-        words = re.findall(r'\b\w+\b', text.lower())
-        if len(words) < n:
-            return []
-        return [' '.join(words[i:i+n]) for i in range(len(words)-n+1)]
-    else:
-        # Use characters
-        text = text.upper()
-        return [text[i:i+n] for i in range(len(text)-n+1)]
+    tokens = _tokenize(text, as_word)
+    if n == 1:
+        # Unigrams are just the tokens themselves, no slicing needed
+        return tokens if as_word else list(tokens)
+    return list(_iter_ngrams(tokens, n, as_word))
 
-def frequency_analysis(text: str, n: int = 1, as_word: bool = False) -> Dict[str, float]:
+def frequency_analysis(text: str, n: int = 1, as_word: bool = False,
+                       ordered: bool = False) -> Dict[str, float]:
     """
     Perform frequency analysis on the text using n-grams.
     
@@ -56,20 +135,112 @@ def frequency_analysis(text: str, n: int = 1, as_word: bool = False) -> Dict[str
         text (str): The text to analyze
         n (int): The size of each n-gram
         as_word (bool): If True, analyze word n-grams instead of character n-grams
+        ordered (bool): If True, list the n-grams from most to least common
     
     Returns:
         Dict[str, float]: Dictionary mapping n-grams to their frequencies (as percentages)
+    
+    Raises:
+        ValueError: If n < 1
     """
-    ngrams = get_ngrams(text, n, as_word)
-    if not ngrams:
-        return {}
+    if n < 1:
+        raise ValueError("n must be at least 1")
     
-    # Count occurrences
-    counts = Counter(ngrams)
+    # Count occurrences without ever materializing the n-gram list
+    counts = _count_ngrams(_tokenize(text, as_word), n, as_word)
+    if not counts:
+        return {}
     total = sum(counts.values())
     
-    # Calculate frequencies as percentages
-    return {ngram: (count/total)*100 for ngram, count in counts.most_common()}
+    # Calculate frequencies as percentages, sorting only when asked to
+    items = counts.most_common() if ordered else counts.items()
+    return {ngram: (count/total)*100 for ngram, count in items}
+
+def frequency_analysis_multi(text: str, ns: List[int], as_word: bool = False) -> Dict[int, Counter]:
+    """
+    Count n-grams of several sizes while tokenizing the text only once.
+    
+    Args:
+        text (str): The text to analyze
+        ns (List[int]): The n-gram sizes to count
+        as_word (bool): If True, count word n-grams instead of character n-grams
+    
+    Returns:
+        Dict[int, Counter]: Counter of n-gram occurrences for each requested size
+    
+    Raises:
+        ValueError: If any n < 1
+    """
+    if any(n < 1 for n in ns):
+        raise ValueError("n must be at least 1")
+    
+    tokens = _tokenize(text, as_word)
+    return {n: _count_ngrams(tokens, n, as_word) for n in ns}
+
+def suffix_array(codes: np.ndarray, depth: int) -> np.ndarray:
+    """
+    Sort the suffixes of a sequence by their first `depth` elements using
+    prefix doubling.
+    
+    Args:
+        codes (np.ndarray): The sequence, e.g. the code points of a text
+        depth (int): How many leading elements of each suffix to compare
+    
+    Returns:
+        np.ndarray: Suffix start positions in sorted order
+    """
+    n = codes.size
+    # Dense ranks of the first element; 0 is reserved for "past the end"
+    rank = np.unique(codes, return_inverse=True)[1].reshape(-1).astype(np.int64) + 1
+    order = np.argsort(rank, kind='stable')
+    covered = 1
+    
+    while covered < depth and rank.max() < n:
+        # Rank by the first 2 * covered elements: the current rank, then the
+        # rank of the suffix starting `covered` places later
+        second = np.zeros(n, dtype=np.int64)
+        second[:n - covered] = rank[covered:]
+        order = np.lexsort((second, rank))
+        changed = (np.diff(rank[order]) != 0) | (np.diff(second[order]) != 0)
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.concatenate(([1], 1 + np.cumsum(changed)))
+        covered *= 2
+    
+    return order
+
+def _adjacent_lcp(codes: np.ndarray, suffixes: np.ndarray, limit: int) -> np.ndarray:
+    """Length of the common prefix of neighbouring suffixes, capped at limit."""
+    if njit is not None:
+        return _adjacent_lcp_kernel(codes, suffixes, limit)
+    
+    # Distinct negative padding so no two suffixes match past the end
+    padded = np.concatenate((codes, -np.arange(1, limit + 1)))
+    previous, current = suffixes[:-1], suffixes[1:]
+    lcp = np.zeros(suffixes.size - 1, dtype=np.int64)
+    same = np.ones(suffixes.size - 1, dtype=bool)
+    for offset in range(limit):
+        same &= padded[previous + offset] == padded[current + offset]
+        lcp += same
+    return lcp
+
+def _scan_repeated_sequences(text: str, alpha_run: List[int], min_length: int,
+                             max_length: int) -> Dict[str, List[int]]:
+    """Find repeated sequences by counting every alphabetic window, one length at a time."""
+    repeated_sequences = {}
+    for length in range(min_length, max_length + 1):
+        starts = [i for i in range(len(text) - length + 1) if alpha_run[i] >= length]
+        
+        # Count every alphabetic sequence of the current length, then collect
+        # positions only for the ones that repeat
+        counts = Counter(text[i:i+length] for i in starts)
+        sequences = {seq: [] for seq, count in counts.items() if count > 1}
+        for i in starts:
+            positions = sequences.get(text[i:i+length])
+            if positions is not None:
+                positions.append(i)
+        
+        repeated_sequences.update(sequences)
+    return repeated_sequences
 
 def find_repeated_sequences(text: str, min_length: int = 3, max_length: int = 10) -> Dict[str, List[int]]:
     """
@@ -86,22 +257,42 @@ def find_repeated_sequences(text: str, min_length: int = 3, max_length: int = 10
     """
     text = text.upper()
     repeated_sequences = {}
+    min_length = max(min_length, 1)
+    if len(text) < 2 or min_length > max_length:
+        return repeated_sequences
+    
+    # alpha_run[i] is the length of the run of letters starting at i, so a
+    # window is alphabetic exactly when the run covers it
+    alpha_run = [0] * (len(text) + 1)
+    run = 0
+    for i, char in zip(range(len(text) - 1, -1, -1), reversed(text)):
+        run = run + 1 if char.isalpha() else 0
+        alpha_run[i] = run
+    
+    if len(text) < _SUFFIX_ARRAY_THRESHOLD:
+        return _scan_repeated_sequences(text, alpha_run, min_length, max_length)
+    
+    # Suffixes sharing a prefix are adjacent in the suffix array, and lcp[k]
+    # says how long the prefix shared by suffixes k and k + 1 is
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    suffixes = suffix_array(codes, max_length)
+    lcp = _adjacent_lcp(codes, suffixes, max_length)
     
     # Check sequences of different lengths
     for length in range(min_length, max_length + 1):
-        sequences = {}
+        # Each run of lcp >= length is one sequence shared by all the
+        # suffixes it spans
+        edges = np.diff(np.concatenate(([0], (lcp >= length).astype(np.int8), [0])))
+        groups = []
+        append = groups.append
+        for start, end in zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()):
+            positions = sorted(suffixes[start:end + 1].tolist())
+            if alpha_run[positions[0]] >= length:  # Only consider alphabetic sequences
+                append(positions)
         
-        # Find all sequences of current length
-        for i in range(len(text) - length + 1):
-            seq = text[i:i+length]
-            if seq.isalpha():  # Only consider alphabetic sequences
-                if seq in sequences:
-                    sequences[seq].append(i)
-                else:
-                    sequences[seq] = [i]
-        
-        # Add sequences that appear more than once
-        repeated_sequences.update({seq: pos for seq, pos in sequences.items() if len(pos) > 1})
+        # Keep the order of first appearance in the text
+        groups.sort()
+        repeated_sequences.update({text[pos[0]:pos[0]+length]: pos for pos in groups})
     
     return repeated_sequences
 
@@ -116,17 +307,22 @@ def index_of_coincidence(text: str) -> float:
     Returns:
         float: The index of coincidence
     """
-    text = ''.join(c for c in text.upper() if c.isalpha())
-    if len(text) <= 1:
-        return 0.0
+    if text.isascii():
+        # Fold case and count the 26 letters in a single bincount
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        letters = (codes | np.uint8(0x20)) - np.uint8(97)
+        frequencies = np.bincount(letters[letters < 26], minlength=26)
+    else:
+        # Accented and other non-ASCII letters count too, so use Counter
+        counts = Counter(c for c in text.upper() if c.isalpha())
+        frequencies = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
     
-    # Count frequencies
-    frequencies = Counter(text)
-    n = len(text)
+    n = int(frequencies.sum())
+    if n <= 1:
+        return 0.0
     
     # Calculate IoC
-    ioc = sum(f * (f-1) for f in frequencies.values()) / (n * (n-1))
-    return ioc
+    return float((frequencies * (frequencies - 1)).sum()) / (n * (n-1))
 
 if __name__ == "__main__":
     # Example usage
@@ -134,19 +330,19 @@ if __name__ == "__main__":
     
     # Character frequency analysis
     print("Character Frequencies:")
-    char_freq = frequency_analysis(sample_text, n=1)
+    char_freq = frequency_analysis(sample_text, n=1, ordered=True)
     for char, freq in char_freq.items():
         print(f"{char}: {freq:.2f}%")
     
     # Bigram analysis
     print("\nBigram Frequencies:")
-    bigram_freq = frequency_analysis(sample_text, n=2)
+    bigram_freq = frequency_analysis(sample_text, n=2, ordered=True)
     for bigram, freq in bigram_freq.items():
         print(f"{bigram}: {freq:.2f}%")
     
     # Word frequency analysis
     print("\nWord Frequencies:")
-    word_freq = frequency_analysis(sample_text, n=1, as_word=True)
+    word_freq = frequency_analysis(sample_text, n=1, as_word=True, ordered=True)
     for word, freq in word_freq.items():
         print(f"{word}: {freq:.2f}%")
     
@@ -14,33 +14,34 @@ Example with 3 rails:
     Ciphertext: "HORELWLOD"
 """
 
-def create_fence(text: str, rails: int) -> list:
+import numpy as np
+
+def rail_order(length: int, rails: int) -> np.ndarray:
     """
-    Create a rail fence pattern from the text.
+    Calculate the order in which text positions are read off the rails.
     
     Args:
-        text (str): The text to arrange
+        length (int): The length of the text
         rails (int): The number of rails to use
     
     Returns:
-        list: A 2D list representing the rail fence
+        np.ndarray: Text indices, rail by rail from top to bottom
+    
+    Raises:
+        ValueError: If rails < 2
     """
-    fence = [['\n' for _ in range(len(text))] for _ in range(rails)]
-    rail = 0
-    direction = 1  # 1 for down, -1 for up
+    if rails < 2:
+        raise ValueError("Number of rails must be at least 2")
     
-    for i in range(len(text)):
-        fence[rail][i] = text[i]
-        
-        # Change direction if we hit the top or bottom rail
-        if rail == 0:
-            direction = 1
-        elif rail == rails - 1:
-            direction = -1
-            
-        rail += direction
-        
-    return fence
+    # The zigzag repeats every 2 * (rails - 1) characters, so the rail of
+    # each position has a closed form
+    period = 2 * (rails - 1)
+    rail = np.arange(length) % period
+    rail = np.where(rail < rails, rail, period - rail)
+    
+    # A stable sort keeps the characters on each rail in text order, and
+    # NumPy radix sorts the small integer types
+    return np.argsort(rail.astype(np.min_scalar_type(rails - 1)), kind='stable')
 
 def encrypt(text: str, rails: int) -> str:
     """
@@ -61,17 +62,9 @@ def encrypt(text: str, rails: int) -> str:
     if rails > len(text):
         raise ValueError("Number of rails cannot be greater than text length")
     
-    # Create the rail fence pattern
-    fence = create_fence(text, rails)
-    
-    # Read off the cipher text
-    result = []
-    for rail in fence:
-        for char in rail:
-            if char != '\n':
-                result.append(char)
-                
-    return ''.join(result)
+    # Read off the cipher text rail by rail
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    return codes[rail_order(len(text), rails)].tobytes().decode('utf-32-le')
 
 def decrypt(text: str, rails: int) -> str:
     """
@@ -92,46 +85,12 @@ def decrypt(text: str, rails: int) -> str:
     if rails > len(text):
         raise ValueError("Number of rails cannot be greater than text length")
     
-    # Create an empty fence
-    fence = [['\n' for _ in range(len(text))] for _ in range(rails)]
-    
-    # Mark the zigzag pattern
-    rail = 0
-    direction = 1
-    for i in range(len(text)):
-        fence[rail][i] = '*'
-        
-        if rail == 0:
-            direction = 1
-        elif rail == rails - 1:
-            direction = -1
-            
-        rail += direction
-    
-    # Fill in the fence with the ciphertext
-    index = 0
-    for i in range(rails):
-        for j in range(len(text)):
-            if fence[i][j] == '*':
-                fence[i][j] = text[index]
-                index += 1
-    
-    # Read off the plaintext
-    result = []
-    rail = 0
-    direction = 1
-    
-    for i in range(len(text)):
-        result.append(fence[rail][i])
-        
-        if rail == 0:
-            direction = 1
-        elif rail == rails - 1:
-            direction = -1
-            
-        rail += direction
-    
-    return ''.join(result)
+    # Ciphertext position k holds the plaintext character at order[k], so
+    # scatter it straight back without building the fence
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    plain = np.empty_like(codes)
+    plain[rail_order(len(text), rails)] = codes
+    return plain.tobytes().decode('utf-32-le')
 
 if __name__ == "__main__":
     # Example usage
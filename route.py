@@ -12,10 +12,62 @@ This implementation supports the following routes:
 4. Diagonal (top-left to bottom-right)
 """
 
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Tuple
 import math
+import numpy as np
 
-def create_grid(text: str, rows: int, cols: int) -> List[List[str]]:
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the pure Python walk is used instead
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _spiral_kernel(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Walk the spiral inward, filling row and column index arrays."""
+        row_idx = np.empty(rows * cols, np.int32)
+        col_idx = np.empty(rows * cols, np.int32)
+        top, bottom = 0, rows - 1
+        left, right = 0, cols - 1
+        k = 0
+        
+        while top <= bottom and left <= right:
+            for i in range(left, right + 1):
+                row_idx[k] = top
+                col_idx[k] = i
+                k += 1
+            top += 1
+            
+            for i in range(top, bottom + 1):
+                row_idx[k] = i
+                col_idx[k] = right
+                k += 1
+            right -= 1
+            
+            if top <= bottom:
+                for i in range(right, left - 1, -1):
+                    row_idx[k] = bottom
+                    col_idx[k] = i
+                    k += 1
+                bottom -= 1
+            
+            if left <= right:
+                for i in range(bottom, top - 1, -1):
+                    row_idx[k] = i
+                    col_idx[k] = left
+                    k += 1
+                left += 1
+        
+        return row_idx, col_idx
+
+def _read_only(row_idx: np.ndarray, col_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Mark cached coordinate arrays read-only so callers cannot corrupt the cache."""
+    row_idx.flags.writeable = False
+    col_idx.flags.writeable = False
+    return row_idx, col_idx
+
+def create_grid(text: str, rows: int, cols: int) -> np.ndarray:
     """
     Create a grid from the text, padding with 'X' if necessary.
     
@@ -25,7 +77,7 @@ def create_grid(text: str, rows: int, cols: int) -> List[List[str]]:
         cols (int): Number of columns in the grid
     
     Returns:
-        List[List[str]]: The grid containing the text
+        np.ndarray: The grid containing the text, as a rows x cols array of code points
     """
     # Remove spaces and convert to uppercase
     text = ''.join(c.upper() for c in text if c.isalnum())
@@ -36,14 +88,15 @@ def create_grid(text: str, rows: int, cols: int) -> List[List[str]]:
         text += 'X' * padding
     
     # Create grid
-    grid = []
-    for i in range(0, len(text), cols):
-        grid.append(list(text[i:i+cols]))
-    
-    return grid
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    return codes[:rows * cols].reshape(rows, cols)
 
-def spiral_inward(rows: int, cols: int) -> List[Tuple[int, int]]:
+@lru_cache(maxsize=128)
+def spiral_inward(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
     """Generate coordinates for spiral inward pattern."""
+    if njit is not None:
+        return _read_only(*_spiral_kernel(rows, cols))
+    
     coordinates = []
     top, bottom = 0, rows - 1
     left, right = 0, cols - 1
@@ -71,35 +124,48 @@ def spiral_inward(rows: int, cols: int) -> List[Tuple[int, int]]:
                 coordinates.append((i, left))
             left += 1
     
-    return coordinates
+    row_idx, col_idx = np.array(coordinates, dtype=np.intp).reshape(-1, 2).T
+    return _read_only(row_idx, col_idx)
 
-def spiral_outward(rows: int, cols: int) -> List[Tuple[int, int]]:
+@lru_cache(maxsize=128)
+def spiral_outward(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
     """Generate coordinates for spiral outward pattern."""
-    return list(reversed(spiral_inward(rows, cols)))
+    # Views of the read-only inward arrays are read-only themselves
+    row_idx, col_idx = spiral_inward(rows, cols)
+    return row_idx[::-1], col_idx[::-1]
 
-def snake_pattern(rows: int, cols: int) -> List[Tuple[int, int]]:
+@lru_cache(maxsize=128)
+def snake_pattern(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
     """Generate coordinates for snake pattern."""
-    coordinates = []
-    for i in range(rows):
-        if i % 2 == 0:
-            # Left to right
-            for j in range(cols):
-                coordinates.append((i, j))
-        else:
-            # Right to left
-            for j in range(cols - 1, -1, -1):
-                coordinates.append((i, j))
-    return coordinates
-
-def diagonal_pattern(rows: int, cols: int) -> List[Tuple[int, int]]:
+    row_idx = np.repeat(np.arange(rows), cols)
+    col_idx = np.tile(np.arange(cols), rows)
+    # Odd rows run right to left
+    flip = (row_idx & 1).astype(bool)
+    col_idx[flip] = cols - 1 - col_idx[flip]
+    return _read_only(row_idx, col_idx)
+
+@lru_cache(maxsize=128)
+def diagonal_pattern(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
     """Generate coordinates for diagonal pattern."""
-    coordinates = []
-    for sum_idx in range(rows + cols - 1):
-        for i in range(rows):
-            j = sum_idx - i
-            if 0 <= j < cols:
-                coordinates.append((i, j))
-    return coordinates
+    row_idx, col_idx = np.indices((rows, cols)).reshape(2, -1)
+    # Walk the anti-diagonals in turn, top to bottom within each one
+    order = np.lexsort((row_idx, row_idx + col_idx))
+    return _read_only(row_idx[order], col_idx[order])
+
+_PATTERNS = {
+    "spiral_in": spiral_inward,
+    "spiral_out": spiral_outward,
+    "snake": snake_pattern,
+    "diagonal": diagonal_pattern
+}
+
+@lru_cache(maxsize=128)
+def _flat_route(pattern: str, rows: int, cols: int) -> np.ndarray:
+    """Return the route as read-only indices into the row-major flattened grid."""
+    row_idx, col_idx = _PATTERNS[pattern](rows, cols)
+    flat = row_idx.astype(np.intp) * cols + col_idx
+    flat.flags.writeable = False
+    return flat
 
 def encrypt(text: str, rows: int, cols: int, pattern: str = "spiral_in") -> str:
     """
@@ -125,24 +191,11 @@ def encrypt(text: str, rows: int, cols: int, pattern: str = "spiral_in") -> str:
     grid = create_grid(text, rows, cols)
     
     # Get coordinates for the chosen pattern
-    pattern_funcs = {
-        "spiral_in": spiral_inward,
-        "spiral_out": spiral_outward,
-        "snake": snake_pattern,
-        "diagonal": diagonal_pattern
-    }
-    
-    if pattern not in pattern_funcs:
-        raise ValueError(f"Invalid pattern. Choose from: {', '.join(pattern_funcs.keys())}")
-    
-    coordinates = pattern_funcs[pattern](rows, cols)
+    if pattern not in _PATTERNS:
+        raise ValueError(f"Invalid pattern. Choose from: {', '.join(_PATTERNS.keys())}")
     
     # Read off the text following the pattern
-    result = []
-    for row, col in coordinates:
-        result.append(grid[row][col])
-    
-    return ''.join(result)
+    return grid.ravel()[_flat_route(pattern, rows, cols)].tobytes().decode('utf-32-le')
 
 def decrypt(text: str, rows: int, cols: int, pattern: str = "spiral_in") -> str:
     """
@@ -167,31 +220,16 @@ def decrypt(text: str, rows: int, cols: int, pattern: str = "spiral_in") -> str:
         raise ValueError("Text length must match grid size")
     
     # Get coordinates for the chosen pattern
-    pattern_funcs = {
-        "spiral_in": spiral_inward,
-        "spiral_out": spiral_outward,
-        "snake": snake_pattern,
-        "diagonal": diagonal_pattern
-    }
-    
-    if pattern not in pattern_funcs:
-        raise ValueError(f"Invalid pattern. Choose from: {', '.join(pattern_funcs.keys())}")
-    
-    coordinates = pattern_funcs[pattern](rows, cols)
+    if pattern not in _PATTERNS:
+        raise ValueError(f"Invalid pattern. Choose from: {', '.join(_PATTERNS.keys())}")
     
-    # Create empty grid
-    grid = [['' for _ in range(cols)] for _ in range(rows)]
-    
-    # Fill grid using the pattern
-    for (row, col), char in zip(coordinates, text):
-        grid[row][col] = char
+    # Fill the flattened grid using the pattern, one scatter with no
+    # per-axis index arithmetic
+    grid = np.empty(rows * cols, dtype=np.uint32)
+    grid[_flat_route(pattern, rows, cols)] = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
     
     # Read grid row by row
-    result = []
-    for row in grid:
-        result.extend(row)
-    
-    return ''.join(result)
+    return grid.tobytes().decode('utf-32-le')
 
 if __name__ == "__main__":
     # Example usage
@@ -12,30 +12,151 @@ Example:
     Result: RIJVS
 """
 
-def prepare_key(text: str, key: str) -> str:
+import re
+import string
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy path is used instead
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _vigenere_kernel(codes: np.ndarray, key_nums: np.ndarray) -> None:
+        """Add the repeating key shifts to the letters of the codes in place."""
+        key_index = 0
+        for i in range(codes.size):
+            c = codes[i]
+            # Branchless letter test, as in august._shift_kernel
+            letter = (c | 0x20) - 97
+            is_letter = (letter >= 0) & (letter < 26)
+            shifted = letter + key_nums[key_index]
+            if shifted >= 26:
+                shifted -= 26
+            codes[i] = shifted + (65 | (c & 0x20)) if is_letter else c
+            key_index += 1 if is_letter else 0
+            if key_index == key_nums.size:
+                key_index = 0
+
+# Without Numba, the per-call overhead of NumPy outweighs the vectorized loop
+# below this length, so short texts go through str.translate instead
+_VECTORIZE_THRESHOLD = 512
+
+def _shifted_alphabet(shift: int) -> str:
+    """Return the upper and lower case alphabets rotated by shift."""
+    upper = string.ascii_uppercase
+    lower = string.ascii_lowercase
+    return upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift]
+
+# One translation table per shift, each a Caesar shift of both cases
+_SHIFT_TABLES = tuple(
+    str.maketrans(string.ascii_uppercase + string.ascii_lowercase, _shifted_alphabet(shift))
+    for shift in range(26)
+)
+
+_NON_LETTERS = re.compile(r'([^A-Za-z]+)')
+
+def _build_shift_lut() -> np.ndarray:
+    """Build the (26, 128) table mapping each key shift and ASCII code to its result."""
+    codes = np.arange(128, dtype=np.uint8)
+    letters = (codes | np.uint8(0x20)) - np.uint8(97)
+    alpha_mask = letters < 26
+    lut = np.tile(codes, (26, 1))
+    for shift in range(26):
+        lut[shift, alpha_mask] = (letters[alpha_mask] + shift) % 26 + (65 | (codes[alpha_mask] & 0x20))
+    lut.flags.writeable = False
+    return lut
+
+# Non-letters map to themselves, so a single gather handles every character
+_SHIFT_LUT = _build_shift_lut()
+
+def _shift_translate(text: str, key: str, sign: int) -> str:
+    """
+    Shift each letter of the text by the matching key letter, translating all
+    letters that share a key position in one str.translate call.
+    
+    Args:
+        text (str): The text to process
+        key (str): The encryption key
+        sign (int): 1 to encrypt, -1 to decrypt
+    
+    Returns:
+        str: The processed text
+    """
+    # Signed shift for each key position, computed once instead of per character
+    shifts = tuple((sign * (code - 65)) % 26 for code in map(ord, key.upper()))
+    key_length = len(shifts)
+    
+    # Even entries are runs of letters, odd entries the text between them
+    parts = _NON_LETTERS.split(text)
+    letters = ''.join(parts[0::2])
+    
+    # Every key_length-th letter uses the same shift, so each residue class
+    # is a plain Caesar shift handled by one translate call
+    shifted = list(letters)
+    tables = _SHIFT_TABLES
+    for position in range(min(key_length, len(letters))):
+        shifted[position::key_length] = letters[position::key_length].translate(tables[shifts[position]])
+    shifted = ''.join(shifted)
+    
+    # Put the shifted letters back between the untouched characters
+    start = 0
+    for index, run in enumerate(parts[0::2]):
+        end = start + len(run)
+        parts[2 * index] = shifted[start:end]
+        start = end
+    return ''.join(parts)
+
+def _shift_vectorized(text: str, key: str, sign: int) -> str:
     """
-    Prepare the key by repeating it to match the length of the text,
-    ignoring non-alphabetic characters in the text.
+    Shift each letter of the text by the matching key letter, using the
+    Numba kernel when available and NumPy otherwise.
     
     Args:
-        text (str): The text to match length with
-        key (str): The key to repeat
+        text (str): The text to process
+        key (str): The encryption key
+        sign (int): 1 to encrypt, -1 to decrypt
     
     Returns:
-        str: The prepared key
+        str: The processed text
     """
-    key = key.upper()
-    key_repeated = ""
-    key_index = 0
-    
-    for char in text:
-        if char.isalpha():
-            key_repeated += key[key_index % len(key)]
-            key_index += 1
-        else:
-            key_repeated += char
-            
-    return key_repeated
+    key_codes = np.frombuffer(key.upper().encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    key_nums = (sign * (key_codes - 65)) % 26
+    
+    if njit is None and text.isascii():
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        alpha_mask = ((codes | np.uint8(0x20)) - np.uint8(97)) < 26
+        # Each letter takes the key shift of its letter count; the others
+        # pick up a neighbour's shift, which the table ignores for them
+        shifts = key_nums[(np.cumsum(alpha_mask) - 1) % key_nums.size]
+        return _SHIFT_LUT[shifts, codes].tobytes().decode('ascii')
+    
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).copy()
+    if njit is not None:
+        _vigenere_kernel(codes, key_nums)
+        return codes.tobytes().decode('utf-32-le')
+    
+    # Case-folded letter test, as in august._shift_codes
+    letters = (codes | np.uint32(0x20)) - np.uint32(97)
+    alpha_mask = letters < 26
+    ascii_base = 65 | (codes[alpha_mask] & 0x20)
+    
+    # Repeat the key over the alphabetic positions only
+    key_expanded = np.resize(key_nums, ascii_base.size)
+    
+    codes[alpha_mask] = (letters[alpha_mask] + key_expanded) % 26 + ascii_base
+    return codes.tobytes().decode('utf-32-le')
+
+def _shift(text: str, key: str, sign: int) -> str:
+    """Dispatch to the scalar or vectorized implementation based on text length."""
+    if not key:
+        raise ValueError("Key must not be empty")
+    # The compiled kernel has no per-call overhead worth avoiding
+    if njit is None and len(text) < _VECTORIZE_THRESHOLD:
+        return _shift_translate(text, key, sign)
+    return _shift_vectorized(text, key, sign)
 
 def encrypt(text: str, key: str) -> str:
     """
@@ -47,26 +168,11 @@ def encrypt(text: str, key: str) -> str:
     
     Returns:
         str: The encrypted text
+    
+    Raises:
+        ValueError: If the key is empty
     """
-    key = prepare_key(text, key)
-    result = ""
-    
-    for text_char, key_char in zip(text, key):
-        if text_char.isalpha():
-            # Determine the case and base ASCII value
-            is_upper = text_char.isupper()
-            text_num = ord(text_char.upper()) - ord('A')
-            key_num = ord(key_char.upper()) - ord('A')
-            
-            # Apply Vigenère shift
-            encrypted_num = (text_num + key_num) % 26
-            encrypted_char = chr(encrypted_num + ord('A'))
-            
-            result += encrypted_char if is_upper else encrypted_char.lower()
-        else:
-            result += text_char
-    
-    return result
+    return _shift(text, key, 1)
 
 def decrypt(text: str, key: str) -> str:
     """
@@ -78,26 +184,11 @@ def decrypt(text: str, key: str) -> str:
     
     Returns:
         str: The decrypted text
+    
+    Raises:
+        ValueError: If the key is empty
     """
-    key = prepare_key(text, key)
-    result = ""
-    
-    for text_char, key_char in zip(text, key):
-        if text_char.isalpha():
-            # Determine the case and base ASCII value
-            is_upper = text_char.isupper()
-            text_num = ord(text_char.upper()) - ord('A')
-            key_num = ord(key_char.upper()) - ord('A')
-            
-            # Apply reverse Vigenère shift
-            decrypted_num = (text_num - key_num) % 26
-            decrypted_char = chr(decrypted_num + ord('A'))
-            
-            result += decrypted_char if is_upper else decrypted_char.lower()
-        else:
-            result += text_char
-    
-    return result
+    return _shift(text, key, -1)
 
 if __name__ == "__main__":
     # Example usage